@@ -2,8 +2,8 @@ import streamlit as st
 import requests
 import json
 import time
-from business_data import load_process_details, OPTION_DESCRIPTIONS
-from data_loader import get_stage_names
+from business_data import load_process_details, get_level_text, get_process, get_stage_qids, OPTION_DESCRIPTIONS
+from data_loader import get_stage_names, get_stage_id
 import pandas as pd
 
 # Perplexity API configuration
@@ -68,9 +68,9 @@ def create_assessment_prompt(bank_name, process_info):
     # Get benchmark data for reference
     benchmark_banks = get_benchmark_data()
     
-    # Extract the stage from the process ID to map to benchmark data
-    process_id = process_info['qid']
-    stage_id = int(process_id[0])
+    # Look up the stage ID of the process to map to benchmark data
+    process_id = process_info.qid
+    stage_id = get_stage_id(process_info.stage)
     
     # Build benchmark reference text
     benchmark_text = "Reference benchmark data from industry leaders:\n"
@@ -90,8 +90,8 @@ def create_assessment_prompt(bank_name, process_info):
     prompt = f"""
     You are a payment systems expert conducting a precise assessment of {bank_name}'s capabilities.
 
-    **Assessment Question {process_info['qid']}**: {process_info['process']}
-    **Process Description**: {process_info['description']}
+    **Assessment Question {process_info.qid}**: {process_info.process}
+    **Process Description**: {process_info.description}
 
     **SCORING SYSTEM (STRICT ADHERENCE REQUIRED):**
     - Basic = 0 points (Total stage score contribution: 0)
@@ -102,16 +102,16 @@ def create_assessment_prompt(bank_name, process_info):
     **MATURITY LEVEL OPTIONS (Choose EXACTLY ONE):**
 
     **Option 1 - Basic (0 points):**
-    {process_info['basic']}
+    {get_level_text(process_id, 'basic')}
 
     **Option 2 - Advanced (0.33 points):**
-    {process_info['advanced']}
+    {get_level_text(process_id, 'advanced')}
 
     **Option 3 - Leading (0.66 points):**
-    {process_info['leading']}
+    {get_level_text(process_id, 'leading')}
 
     **Option 4 - Emerging (1.0 points):**
-    {process_info['emerging']}
+    {get_level_text(process_id, 'emerging')}
 
     {benchmark_text}
 
@@ -206,7 +206,7 @@ def assess_bank_with_ai(bank_name, progress_callback=None):
     
     for i, process_info in enumerate(process_data):
         if progress_callback:
-            progress_callback(i + 1, total_processes, f"Assessing {process_info['qid']}: {process_info['process']}")
+            progress_callback(i + 1, total_processes, f"Assessing {process_info.qid}: {process_info.process}")
         
         # Create prompt for this specific process
         prompt = create_assessment_prompt(bank_name, process_info)
@@ -216,12 +216,12 @@ def assess_bank_with_ai(bank_name, progress_callback=None):
         
         if ai_response:
             score, justification = parse_ai_response(ai_response)
-            assessment_results[process_info['qid']] = score
-            detailed_justifications[process_info['qid']] = justification
+            assessment_results[process_info.qid] = score
+            detailed_justifications[process_info.qid] = justification
         else:
             # Fallback to basic level if API fails
-            assessment_results[process_info['qid']] = 0.00
-            detailed_justifications[process_info['qid']] = "Basic: Assessment failed, using default"
+            assessment_results[process_info.qid] = 0.00
+            detailed_justifications[process_info.qid] = "Basic: Assessment failed, using default"
         
         # Small delay to respect API rate limits
         time.sleep(0.5)
@@ -333,13 +333,12 @@ def display_ai_assessment_details(bank_name):
         
         # Calculate scores by stage following questionnaire structure
         stage_names = get_stage_names()
-        process_data = load_process_details()
         
         stage_scores = {}
         for stage_id in range(1, 13):
-            stage_processes = [p for p in process_data if p['stage'].startswith(stage_names[stage_id])]
+            stage_qids = get_stage_qids(stage_names[stage_id])
             # Sum of 4 process scores (each 0, 0.33, 0.66, or 1.0) = max 4.0 per stage
-            stage_total = sum(assessment_data.get(p['qid'], 0) for p in stage_processes)
+            stage_total = sum(assessment_data.get(qid, 0) for qid in stage_qids)
             stage_scores[stage_id] = stage_total
         
         # Create summary DataFrame
@@ -358,16 +357,15 @@ def display_ai_assessment_details(bank_name):
         st.subheader("Detailed Process Assessments")
         
         # Group by stage for better organization
-        process_data = load_process_details()
         stage_names = get_stage_names()
         
         for stage_id in range(1, 13):
-            stage_processes = [p for p in process_data if p['stage'].startswith(stage_names[stage_id])]
+            stage_qids = get_stage_qids(stage_names[stage_id])
             
-            if stage_processes:
+            if stage_qids:
                 with st.expander(f"Stage {stage_id}: {stage_names[stage_id]}"):
-                    for process in stage_processes:
-                        qid = process['qid']
+                    for qid in stage_qids:
+                        process = get_process(qid)
                         score = assessment_data.get(qid, 0)
                         justification = justifications.get(qid, "No justification available")
                         
@@ -379,7 +377,7 @@ def display_ai_assessment_details(bank_name):
                         else:
                             color = "🔴"
                         
-                        st.write(f"{color} **{qid}. {process['process']}**")
+                        st.write(f"{color} **{qid}. {process.process}**")
                         st.write(f"Score: {score:.2f}/1.00")
                         st.write(f"AI Analysis: {justification}")
                         st.markdown("---")
@@ -396,7 +394,6 @@ def display_ai_assessment_details(bank_name):
             
             # Convert to stage-based scores for comparison
             stage_scores = {}
-            process_data = load_process_details()
             stage_names = get_stage_names()
             
             # Get benchmark data to normalize scores
@@ -415,10 +412,10 @@ def display_ai_assessment_details(bank_name):
             # Each stage has exactly 4 processes, each scoring 0, 0.33, 0.66, or 1.0
             # Stage score = sum of all 4 process scores (max 4.0 per stage)
             for stage_id in range(1, 13):
-                stage_processes = [p for p in process_data if p['stage'].startswith(stage_names[stage_id])]
+                stage_qids = get_stage_qids(stage_names[stage_id])
                 
                 # Sum the individual process scores (already following 0, 0.33, 0.66, 1.0 scale)
-                stage_total = sum(assessment_data.get(p['qid'], 0) for p in stage_processes)
+                stage_total = sum(assessment_data.get(qid, 0) for qid in stage_qids)
                 
                 # Store the stage score directly (no normalization needed)
                 # This matches the questionnaire structure: sum of 4 process scores
@@ -442,13 +439,12 @@ def display_ai_assessment_details(bank_name):
         
         # Find strongest and weakest areas
         stage_scores = {}
-        process_data = load_process_details()
         stage_names = get_stage_names()
         
         for stage_id in range(1, 13):
-            stage_processes = [p for p in process_data if p['stage'].startswith(stage_names[stage_id])]
-            if stage_processes:
-                stage_avg = sum(assessment_data.get(p['qid'], 0) for p in stage_processes) / len(stage_processes)
+            stage_qids = get_stage_qids(stage_names[stage_id])
+            if stage_qids:
+                stage_avg = sum(assessment_data.get(qid, 0) for qid in stage_qids) / len(stage_qids)
                 stage_scores[stage_id] = stage_avg
         
         if stage_scores:
@@ -1,7 +1,7 @@
 import streamlit as st
 import requests
 import json
-from business_data import load_process_details
+from business_data import load_process_details, get_level_text
 from data_loader import load_data
 
 def create_comprehensive_bank_profile(bank_name):
@@ -160,7 +160,7 @@ def create_specialist_assessment_prompt(bank_name, process_info):
     }
     
     # Extract stage number from process ID
-    process_id = process_info.get('qid', '1.1')
+    process_id = process_info.qid
     stage_num = process_id.split('.')[0] if '.' in process_id else process_id[0]
     stage_context = stage_contexts.get(stage_num, stage_contexts["1"])
     
@@ -192,13 +192,13 @@ ASSESSMENT DOMAIN: {stage_context['area']}
 📋 Regulatory Landscape: {stage_context['regulatory_focus']}
 
 SPECIFIC CAPABILITY EVALUATION:
-"{process_info['question']}"
+"{process_info.process}"
 
 MATURITY FRAMEWORK (Select ONE option number):
-1️⃣ BASIC (0.0 points): {process_info['basic']}
-2️⃣ ADVANCED (0.33 points): {process_info['advanced']}
-3️⃣ LEADING (0.66 points): {process_info['leading']}
-4️⃣ EMERGING (1.0 points): {process_info['emerging']}
+1️⃣ BASIC (0.0 points): {get_level_text(process_id, 'basic')}
+2️⃣ ADVANCED (0.33 points): {get_level_text(process_id, 'advanced')}
+3️⃣ LEADING (0.66 points): {get_level_text(process_id, 'leading')}
+4️⃣ EMERGING (1.0 points): {get_level_text(process_id, 'emerging')}
 
 {benchmark_context}
 
@@ -332,7 +332,7 @@ def assess_bank_with_specialist_ai(bank_name, progress_callback=None):
     
     for i, process in enumerate(process_data):
         if progress_callback:
-            progress_callback(i + 1, total_processes, f"Assessing {process['question'][:50]}...")
+            progress_callback(i + 1, total_processes, f"Assessing {process.process[:50]}...")
         
         # Create specialist prompt
         prompt = create_specialist_assessment_prompt(bank_name, process)
@@ -342,17 +342,17 @@ def assess_bank_with_specialist_ai(bank_name, progress_callback=None):
         
         if response:
             score, rationale = parse_specialist_response(response)
-            assessment_results[process['qid']] = {
+            assessment_results[process.qid] = {
                 'score': score,
                 'rationale': rationale,
-                'question': process['question']
+                'question': process.process
             }
         else:
             # Fallback with conservative scoring
-            assessment_results[process['qid']] = {
+            assessment_results[process.qid] = {
                 'score': 0.33,  # Default to Advanced level
                 'rationale': f"Assessment unavailable - defaulted to Advanced level",
-                'question': process['question']
+                'question': process.process
             }
         
         # Brief pause to avoid rate limiting
@@ -6,7 +6,6 @@ from business_outcomes_mapper import (
     get_business_outcomes,
     calculate_outcome_score,
     get_outcome_process_details,
-    get_outcome_summary,
     create_outcome_radar_data
 )
 from data_loader import load_data, get_bank_names, get_bank_scores
@@ -1,3 +1,4 @@
+import functools
 import pandas as pd
 
 # Define the business outcomes and their associated processes
@@ -28,13 +29,15 @@ BUSINESS_OUTCOME_MAP = {
     ]
 }
 
+@functools.lru_cache(maxsize=None)
 def get_business_outcomes():
-    """Returns a list of all business outcomes."""
-    return list(BUSINESS_OUTCOME_MAP.keys())
+    """Returns a tuple of all business outcomes."""
+    return tuple(BUSINESS_OUTCOME_MAP.keys())
 
+@functools.lru_cache(maxsize=None)
 def get_processes_for_outcome(outcome):
-    """Returns the list of process IDs associated with a business outcome."""
-    return BUSINESS_OUTCOME_MAP.get(outcome, [])
+    """Returns the tuple of process IDs associated with a business outcome."""
+    return tuple(BUSINESS_OUTCOME_MAP.get(outcome, ()))
 
 def calculate_outcome_score(process_values, outcome):
     """Calculate the average score for a business outcome based on process scores."""
@@ -61,19 +64,17 @@ def get_outcome_process_details(process_values, questions, outcome):
 
 def get_outcome_summary(process_values):
     """Generate summary statistics for all business outcomes."""
-    summary = []
-    
-    for outcome in get_business_outcomes():
-        score = calculate_outcome_score(process_values, outcome)
-        process_count = len(get_processes_for_outcome(outcome))
-        
-        summary.append({
-            "Outcome": outcome,
-            "Score": score,
-            "Process Count": process_count
-        })
+    return create_outcome_summary_dataframe(process_values).to_dict("records")
+
+def create_outcome_summary_dataframe(process_values):
+    """Build the business outcome summary table column by column."""
+    outcomes = get_business_outcomes()
     
-    return summary
+    return pd.DataFrame({
+        "Outcome": outcomes,
+        "Score": [calculate_outcome_score(process_values, outcome) for outcome in outcomes],
+        "Process Count": [len(get_processes_for_outcome(outcome)) for outcome in outcomes]
+    })
 
 def create_outcome_radar_data(process_values):
     """Generate data for the radar chart by business outcome."""
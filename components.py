@@ -1,20 +1,31 @@
 import streamlit as st
 import pandas as pd
-from business_data import OPTION_DESCRIPTIONS, load_process_details
+from business_data import (
+    OPTION_VALUES,
+    LEVEL_DESCRIPTIONS,
+    Maturity,
+    score_levels,
+    PROCESS_NAMES,
+    get_level_text
+)
 from business_outcomes_mapper import (
     get_business_outcomes,
     get_processes_for_outcome,
     calculate_outcome_score,
     get_outcome_process_details,
-    get_outcome_summary,
+    create_outcome_summary_dataframe,
     create_outcome_radar_data
 )
 from data_loader import (
     load_data,
     get_bank_names,
     get_bank_scores,
+    get_bank_process_values,
+    get_bank_outcome_scores,
     get_stage_names,
-    get_process_data_for_stage
+    STAGE_PROCESSES,
+    QIDS,
+    QID_STAGE_CAT
 )
 from visualization import (
     create_radar_chart,
@@ -23,6 +34,13 @@ from visualization import (
     create_maturity_heatmap
 )
 
+# Maturity level labels and their score values
+MATURITY_OPTIONS = ["Basic (1)", "Advanced (2)", "Leading (3)", "Emerging (4)"]
+MATURITY_SCORES = OPTION_VALUES
+
+# Banks preselected for benchmark comparison
+DEFAULT_BENCHMARKS = ("JPMC (Global)", "DBS (Asia)")
+
 def render_bank_selection(banks, mode="single"):
     """
     Render bank selection component
@@ -48,23 +66,10 @@ def render_bank_selection(banks, mode="single"):
 def render_maturity_scale():
     """Render a description of the maturity scale"""
     with st.expander("About the Maturity Scale"):
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown("### Basic (1)")
-            st.write(OPTION_DESCRIPTIONS["Basic"]["description"])
-        
-        with col2:
-            st.markdown("### Advanced (2)")
-            st.write(OPTION_DESCRIPTIONS["Advanced"]["description"])
-        
-        with col3:
-            st.markdown("### Leading (3)")
-            st.write(OPTION_DESCRIPTIONS["Leading"]["description"])
-        
-        with col4:
-            st.markdown("### Emerging (4)")
-            st.write(OPTION_DESCRIPTIONS["Emerging"]["description"])
+        for col, level in zip(st.columns(4), Maturity):
+            with col:
+                st.markdown(f"### {MATURITY_OPTIONS[level]}")
+                st.write(LEVEL_DESCRIPTIONS[level])
 
 def render_process_assessment(process_data, stage_id):
     """
@@ -77,37 +82,35 @@ def render_process_assessment(process_data, stage_id):
     Returns:
     - Total score for the stage (sum of all process scores)
     """
-    stage_total = 0
-    process_count = 0
+    level_codes = []
     
     for process in process_data:
-        st.subheader(f"{process['qid']}. {process['process']}")
-        st.write(process['description'])
+        st.subheader(f"{process.qid}. {process.process}")
+        st.write(process.description)
         
         with st.expander("See maturity level descriptions"):
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("#### Basic")
-                st.write(process['basic'])
+                st.write(get_level_text(process.qid, 'basic'))
                 
                 st.markdown("#### Advanced")
-                st.write(process['advanced'])
+                st.write(get_level_text(process.qid, 'advanced'))
             
             with col2:
                 st.markdown("#### Leading")
-                st.write(process['leading'])
+                st.write(get_level_text(process.qid, 'leading'))
                 
                 st.markdown("#### Emerging")
-                st.write(process['emerging'])
+                st.write(get_level_text(process.qid, 'emerging'))
         
         # Selection for maturity level
-        maturity_options = ["Basic (1)", "Advanced (2)", "Leading (3)", "Emerging (4)"]
         current_value = None
         
         # Check if there's already a value in session state
-        if process['qid'] in st.session_state.assessment_data:
-            current_value = st.session_state.assessment_data[process['qid']]
+        if process.qid in st.session_state.assessment_data:
+            current_value = st.session_state.assessment_data[process.qid]
             # Map the decimal value to the closest maturity level
             if current_value < 0.17:  # Basic
                 default_index = 0
@@ -121,73 +124,37 @@ def render_process_assessment(process_data, stage_id):
             default_index = 0
         
         selected_maturity = st.select_slider(
-            f"Select maturity level for {process['process']}",
-            options=maturity_options,
-            value=maturity_options[default_index]
+            f"Select maturity level for {process.process}",
+            options=MATURITY_OPTIONS,
+            value=MATURITY_OPTIONS[default_index]
         )
         
-        # Extract numeric value from selection
-        maturity_label = selected_maturity.split("(")[0].strip()
-        
-        # Convert label to score value based on new scoring system
-        if maturity_label == "Basic":
-            maturity_value = 0.00
-        elif maturity_label == "Advanced":
-            maturity_value = 0.33
-        elif maturity_label == "Leading":
-            maturity_value = 0.66
-        elif maturity_label == "Emerging":
-            maturity_value = 1.00
-        else:
-            maturity_value = 0.00
+        # Convert label to its level code, then to the score value
+        level_code = MATURITY_OPTIONS.index(selected_maturity)
+        maturity_value = float(score_levels(level_code))
         
-        # Store in session state
-        st.session_state.assessment_data[process['qid']] = maturity_value
+        # Store in session state, skipping writes that would not change anything
+        if st.session_state.assessment_data.get(process.qid) != maturity_value:
+            st.session_state.assessment_data[process.qid] = maturity_value
         
-        # Accumulate for total score calculation
-        stage_total += maturity_value
-        process_count += 1
+        # Keep the level code for the total score calculation
+        level_codes.append(level_code)
         
         st.markdown("---")
     
     # Return the total score for the stage (max 4 points)
-    return stage_total
+    return float(score_levels(level_codes).sum())
 
-def render_assessment_view(process_data):
+def render_stage_assessment(selected_stage, banks_data):
     """
-    Render the assessment tool view
+    Render the assessment form, stage results and benchmark chart for a stage
     
     Parameters:
-    - process_data: Complete process data
+    - selected_stage: Current stage ID
+    - banks_data: Benchmark scores by bank
     """
-    st.header("Payment Capability Assessment")
-    st.write("Evaluate your organization's payment capabilities across 12 stages")
-    
-    render_maturity_scale()
-    
-    # Get stage names
-    stage_names = get_stage_names()
-    
-    # Stage selection
-    # Check if current_stage is already set in session state
-    if 'current_stage' not in st.session_state:
-        st.session_state.current_stage = 1
-        
-    # Use the current_stage from session state as the default index
-    selected_stage = st.selectbox(
-        "Select a stage to assess:",
-        options=list(range(1, 13)),
-        index=st.session_state.current_stage - 1,
-        format_func=lambda x: f"Stage {x}: {stage_names[x]}"
-    )
-    
-    # Update current_stage in session state when selectbox changes
-    st.session_state.current_stage = selected_stage
-    
-    st.markdown(f"## Stage {selected_stage}: {stage_names[selected_stage]}")
-    
     # Get processes for the selected stage
-    stage_processes = get_process_data_for_stage(selected_stage)
+    stage_processes = STAGE_PROCESSES[selected_stage]
     
     # Display the assessment form
     stage_score = render_process_assessment(stage_processes, selected_stage)
@@ -201,26 +168,153 @@ def render_assessment_view(process_data):
     
     # Benchmark comparison
     st.markdown("## Benchmark Comparison")
-    banks_data, _ = load_data()
     
     # Allow user to select benchmark banks for comparison
-    all_banks = list(banks_data.keys())
     benchmark_banks = st.multiselect(
         "Select banks for benchmark comparison:",
-        options=all_banks,
-        default=["JPMC (Global)", "DBS (Asia)"]
+        options=get_bank_names(),
+        default=DEFAULT_BENCHMARKS
     )
     
     if not benchmark_banks:
         st.warning("Please select at least one bank for benchmark comparison")
         # Default to top banks if none selected
-        benchmark_banks = ["JPMC (Global)", "DBS (Asia)"]
+        benchmark_banks = list(DEFAULT_BENCHMARKS)
+    
+    # Shared with the overall results section
+    st.session_state.benchmark_banks = benchmark_banks
     
     # Filter to only include selected banks for comparison
     comparison_banks = {bank: scores for bank, scores in banks_data.items() if bank in benchmark_banks}
     
     chart = create_stage_chart(st.session_state.assessment_data, selected_stage, comparison_banks)
     st.plotly_chart(chart, use_container_width=True)
+
+# Stage section as a fragment, so that moving a maturity slider only reruns this section
+_stage_assessment_fragment = st.fragment(render_stage_assessment)
+
+@st.fragment
+def render_overall_results(banks_data):
+    """
+    Render the overall assessment results and benchmark radar chart
+    
+    Runs as a fragment so that competitor selection only reruns this section.
+    
+    Parameters:
+    - banks_data: Benchmark scores by bank
+    """
+    st.markdown("## Overall Assessment Results")
+    
+    stage_names = get_stage_names()
+    all_banks = get_bank_names()
+    benchmark_banks = st.session_state.get('benchmark_banks', DEFAULT_BENCHMARKS)
+    
+    # Calculate sum of scores per stage in a single groupby
+    assessment_series = pd.Series(st.session_state.assessment_data, dtype=float).reindex(QIDS, fill_value=0)
+    stage_scores = assessment_series.groupby(QID_STAGE_CAT, observed=False, sort=False).sum().to_dict()
+    
+    # Overall total (out of 48 possible points - 12 stages × 4 points)
+    overall_total = float(assessment_series.sum())
+    max_possible = 48.0  # 12 stages × 4 points per stage
+        
+    st.metric("Overall Maturity Score", f"{overall_total:.2f}/{max_possible:.2f}")
+    
+    # Create results dataframe
+    results_df = pd.DataFrame({
+        "Stage": [f"{i}. {stage_names[i]}" for i in range(1, 13)],
+        "Score": [stage_scores.get(i, 0) for i in range(1, 13)]
+    })
+    
+    st.table(results_df)
+    
+    # Radar chart comparison with benchmarks
+    st.subheader("Comparison with Industry Benchmarks")
+    
+    # Competitor Selection for comparison
+    st.markdown("### Competitor Selection")
+    show_all = st.checkbox("Show all competitors on radar", value=False)
+    
+    # Allow selecting benchmark banks for overall comparison
+    if not show_all:
+        benchmark_banks = st.multiselect(
+            "Select competitors to compare",
+            options=all_banks,
+            default=benchmark_banks[:2] if len(benchmark_banks) >= 2 else benchmark_banks
+        )
+        
+        if not benchmark_banks:
+            st.warning("Please select at least one bank for comparison")
+            benchmark_banks = list(DEFAULT_BENCHMARKS[:1])
+    else:
+        benchmark_banks = all_banks
+    
+    # Prepare data for comparison including user assessment
+    assessment_data = {"Your Assessment": {**stage_scores, "Overall": overall_total}}
+    
+    # Add assessment to bank data
+    combined_data = {**assessment_data, **banks_data}
+    
+    # Create radar chart with selected benchmarks
+    radar_banks = ["Your Assessment", *benchmark_banks]
+    
+    radar_fig = create_radar_chart(
+        combined_data,
+        radar_banks,
+        "Your Assessment vs Industry Leaders"
+    )
+    
+    st.plotly_chart(radar_fig, use_container_width=True, key="assessment_radar")
+    
+    # Reset view results state
+    if st.button("Back to Assessment"):
+        st.session_state.view_results = False
+        st.rerun()
+        
+    # Store assessment data in session state for use in other views
+    st.session_state.assessment_stage_scores = stage_scores
+    st.session_state.assessment_overall_total = overall_total
+    st.session_state.assessment_overall_avg = overall_total / 12  # For radar chart comparison
+
+def render_assessment_view(process_data):
+    """
+    Render the assessment tool view
+    
+    Parameters:
+    - process_data: Complete process data
+    """
+    st.header("Payment Capability Assessment")
+    st.write("Evaluate your organization's payment capabilities across 12 stages")
+    
+    render_maturity_scale()
+    
+    # Get stage names and benchmark data
+    stage_names = get_stage_names()
+    banks_data, _ = load_data()
+    
+    # Stage selection
+    # Check if current_stage is already set in session state
+    if 'current_stage' not in st.session_state:
+        st.session_state.current_stage = 1
+        
+    # Use the current_stage from session state as the default index
+    selected_stage = st.selectbox(
+        "Select a stage to assess:",
+        options=list(range(1, 13)),
+        index=st.session_state.current_stage - 1,
+        format_func=lambda x: f"Stage {x}: {stage_names[x]}"
+    )
+    
+    # Update current_stage in session state when selectbox changes
+    st.session_state.current_stage = selected_stage
+    
+    st.markdown(f"## Stage {selected_stage}: {stage_names[selected_stage]}")
+    
+    # Assessment form, stage results and benchmark chart. The overall results read every
+    # score and the benchmark banks, so while they are shown the section reruns with the page.
+    if st.session_state.get('view_results', False):
+        render_stage_assessment(selected_stage, banks_data)
+    else:
+        _stage_assessment_fragment(selected_stage, banks_data)
     
     # Navigation buttons
     col1, col2, col3 = st.columns([1, 1, 1])
@@ -244,88 +338,7 @@ def render_assessment_view(process_data):
     
     # Overall results view
     if st.session_state.get('view_results', False):
-        st.markdown("## Overall Assessment Results")
-        
-        # Calculate sum of scores per stage
-        stage_scores = {}
-        for stage_id in range(1, 13):
-            stage_processes = get_process_data_for_stage(stage_id)
-            process_ids = [p['qid'] for p in stage_processes]
-            
-            # Filter the assessment data to get only processes for this stage
-            stage_assessment = {pid: st.session_state.assessment_data.get(pid, 0) 
-                               for pid in process_ids if pid in st.session_state.assessment_data}
-            
-            if stage_assessment:
-                stage_scores[stage_id] = sum(stage_assessment.values())
-            else:
-                stage_scores[stage_id] = 0
-        
-        # Overall total (out of 48 possible points - 12 stages × 4 points)
-        if stage_scores:
-            overall_total = sum(stage_scores.values())
-            max_possible = 48.0  # 12 stages × 4 points per stage
-        else:
-            overall_total = 0
-            max_possible = 48.0
-            
-        st.metric("Overall Maturity Score", f"{overall_total:.2f}/{max_possible:.2f}")
-        
-        # Create results dataframe
-        results_df = pd.DataFrame({
-            "Stage": [f"{i}. {stage_names[i]}" for i in range(1, 13)],
-            "Score": [stage_scores.get(i, 0) for i in range(1, 13)]
-        })
-        
-        st.dataframe(results_df, use_container_width=True)
-        
-        # Radar chart comparison with benchmarks
-        st.subheader("Comparison with Industry Benchmarks")
-        
-        # Competitor Selection for comparison
-        st.markdown("### Competitor Selection")
-        show_all = st.checkbox("Show all competitors on radar", value=False)
-        
-        # Allow selecting benchmark banks for overall comparison
-        if not show_all:
-            benchmark_banks = st.multiselect(
-                "Select competitors to compare",
-                options=all_banks,
-                default=benchmark_banks[:2] if len(benchmark_banks) >= 2 else benchmark_banks
-            )
-            
-            if not benchmark_banks:
-                st.warning("Please select at least one bank for comparison")
-                benchmark_banks = ["JPMC (Global)"]
-        else:
-            benchmark_banks = all_banks
-        
-        # Prepare data for comparison including user assessment
-        assessment_data = {"Your Assessment": {**stage_scores, "Overall": overall_total}}
-        
-        # Add assessment to bank data
-        combined_data = {**assessment_data, **banks_data}
-        
-        # Create radar chart with selected benchmarks
-        radar_banks = ["Your Assessment"] + benchmark_banks
-        
-        radar_fig = create_radar_chart(
-            combined_data,
-            radar_banks,
-            "Your Assessment vs Industry Leaders"
-        )
-        
-        st.plotly_chart(radar_fig, use_container_width=True)
-        
-        # Reset view results state
-        if st.button("Back to Assessment"):
-            st.session_state.view_results = False
-            st.rerun()
-            
-        # Store assessment data in session state for use in other views
-        st.session_state.assessment_stage_scores = stage_scores
-        st.session_state.assessment_overall_total = overall_total
-        st.session_state.assessment_overall_avg = overall_total / 12  # For radar chart comparison
+        render_overall_results(banks_data)
 
 def render_comparison_view(banks):
     """
@@ -398,51 +411,45 @@ def render_comparison_view(banks):
         selected_banks, 
         "Bank Payment Capability Comparison"
     )
-    st.plotly_chart(radar_fig, use_container_width=True)
+    st.plotly_chart(radar_fig, use_container_width=True, key="comparison_radar")
     
     # Maturity heatmap
     st.subheader("Maturity Heatmap")
     heatmap_fig = create_maturity_heatmap(combined_data, selected_banks)
-    st.plotly_chart(heatmap_fig, use_container_width=True)
+    st.plotly_chart(heatmap_fig, use_container_width=True, key="comparison_heatmap")
     
     # Detailed comparison table
     st.subheader("Detailed Scores by Stage")
     
     stage_names = get_stage_names()
-    comparison_data = []
-    
-    for bank in selected_banks:
-        if bank in combined_data:
-            bank_data = combined_data[bank]
-            row = {"Bank": bank}
-            for stage_id in range(1, 13):
-                row[f"Stage {stage_id}"] = bank_data.get(stage_id, 0)
-            row["Overall"] = bank_data.get("Overall", 0)
-            comparison_data.append(row)
-    
-    comparison_df = pd.DataFrame(comparison_data)
+    table_banks = [bank for bank in selected_banks if bank in combined_data]
+    
+    # Build the table column by column
+    comparison_columns = {"Bank": table_banks}
+    for stage_id in range(1, 13):
+        comparison_columns[f"Stage {stage_id}"] = [combined_data[bank].get(stage_id, 0) for bank in table_banks]
+    comparison_columns["Overall"] = [combined_data[bank].get("Overall", 0) for bank in table_banks]
+    
+    comparison_df = pd.DataFrame(comparison_columns)
     st.dataframe(comparison_df, use_container_width=True)
     
     # Performance insights
     st.subheader("Key Insights")
     
-    if len(selected_banks) >= 2:
+    if len(selected_banks) >= 2 and not comparison_df.empty:
         # Find best performing bank overall
-        best_bank = max(selected_banks, key=lambda x: combined_data[x].get("Overall", 0))
-        best_score = combined_data[best_bank].get("Overall", 0)
+        overall_scores = comparison_df.set_index("Bank")["Overall"]
+        best_bank = overall_scores.idxmax()
+        best_score = overall_scores[best_bank]
         
         st.success(f"**Top Performer:** {best_bank} with overall score of {best_score:.2f}")
         
         # Find stage with highest variation
-        stage_variances = {}
-        for stage_id in range(1, 13):
-            scores = [combined_data[bank].get(stage_id, 0) for bank in selected_banks if bank in combined_data]
-            if scores:
-                stage_variances[stage_id] = max(scores) - min(scores)
-        
-        if stage_variances:
-            max_variance_stage = max(stage_variances, key=stage_variances.get)
-            st.info(f"**Highest Variation:** Stage {max_variance_stage} ({stage_names[max_variance_stage]}) shows the largest capability gap between institutions")
+        stage_scores = comparison_df[[f"Stage {stage_id}" for stage_id in range(1, 13)]].set_axis(range(1, 13), axis=1)
+        stage_variances = stage_scores.max() - stage_scores.min()
+        
+        max_variance_stage = stage_variances.idxmax()
+        st.info(f"**Highest Variation:** Stage {max_variance_stage} ({stage_names[max_variance_stage]}) shows the largest capability gap between institutions")
 
 def render_bank_outcome_analysis(banks):
     """
@@ -454,12 +461,8 @@ def render_bank_outcome_analysis(banks):
     st.header("Business Outcome Analysis")
     st.write("Analyze how payment capabilities contribute to specific business outcomes")
     
-    # Load data
-    banks_data, _ = load_data()
-    
     # Get questions mapping
-    process_data = load_process_details()
-    questions = {p['qid']: p['process'] for p in process_data}
+    questions = PROCESS_NAMES
     
     # Create tabs for different analyses
     tab1, tab2 = st.tabs(["Your Assessment", "Bank Comparison"])
@@ -480,12 +483,10 @@ def render_bank_outcome_analysis(banks):
         st.plotly_chart(radar_fig, use_container_width=True)
         
         # Create outcome summary table
-        summary = get_outcome_summary(st.session_state.assessment_data)
-        summary_df = pd.DataFrame(summary)
-        summary_df = summary_df.sort_values("Score", ascending=False)
+        summary_df = create_outcome_summary_dataframe(st.session_state.assessment_data).sort_values("Score", ascending=False, ignore_index=True, kind="stable")
         
         st.subheader("Business Outcome Summary")
-        st.dataframe(summary_df, use_container_width=True)
+        st.table(summary_df)
         
         # Detailed analysis for a selected outcome
         st.subheader("Detailed Outcome Analysis")
@@ -511,7 +512,7 @@ def render_bank_outcome_analysis(banks):
         
         # Create process breakdown table
         process_df = pd.DataFrame(outcome_processes)
-        st.dataframe(process_df, use_container_width=True)
+        st.table(process_df)
         
         # Recommendations based on score
         st.subheader("Recommendations")
@@ -548,14 +549,7 @@ def render_bank_outcome_analysis(banks):
             return
         
         # Create process-to-score mapping
-        process_values = {}
-        for stage in range(1, 13):
-            stage_processes = get_process_data_for_stage(stage)
-            stage_score = bank_scores.get(stage, 0)
-            
-            # Distribute stage score across processes (simplified approach)
-            for process in stage_processes:
-                process_values[process['qid']] = stage_score / len(stage_processes)
+        process_values = get_bank_process_values(selected_bank)
         
         # Get outcome data
         outcome_data = create_outcome_radar_data(process_values)
@@ -565,12 +559,10 @@ def render_bank_outcome_analysis(banks):
         st.plotly_chart(radar_fig, use_container_width=True)
         
         # Create outcome summary table
-        summary = get_outcome_summary(process_values)
-        summary_df = pd.DataFrame(summary)
-        summary_df = summary_df.sort_values("Score", ascending=False)
+        summary_df = create_outcome_summary_dataframe(process_values).sort_values("Score", ascending=False, ignore_index=True, kind="stable")
         
         st.subheader(f"Business Outcome Summary for {selected_bank}")
-        st.dataframe(summary_df, use_container_width=True)
+        st.table(summary_df)
 
 def render_outcome_analysis(process_data, banks):
     """
@@ -583,9 +575,6 @@ def render_outcome_analysis(process_data, banks):
     st.header("Business Outcome Analysis & Improvement")
     st.write("Analyze and improve business outcomes with targeted process enhancements")
     
-    # Load data
-    banks_data, _ = load_data()
-    from data_loader import KPI_MATRIX
     
     # Convert data from the Excel image to a structured format for PPE implementation data
     PPE_IMPLEMENTATION_DATA = {
@@ -640,7 +629,7 @@ def render_outcome_analysis(process_data, banks):
     }
     
     # Get questions mapping
-    questions = {p['qid']: p['process'] for p in process_data}
+    questions = PROCESS_NAMES
     
     # Create tabs for different analyses
     tab1, tab2 = st.tabs(["Current Status", "Business Outcome Improvement"])
@@ -665,15 +654,14 @@ def render_outcome_analysis(process_data, banks):
         st.plotly_chart(radar_fig, use_container_width=True)
         
         # Create outcome summary table
-        summary = get_outcome_summary(st.session_state.assessment_data)
-        for item in summary:
-            item["Score"] = round(item["Score"], 2)
-        
-        summary_df = pd.DataFrame(summary)
-        summary_df = summary_df.sort_values("Score", ascending=False)
+        summary_df = (
+            create_outcome_summary_dataframe(st.session_state.assessment_data)
+            .round({"Score": 2})
+            .sort_values("Score", ascending=False, ignore_index=True, kind="stable")
+        )
         
         st.subheader("Business Outcome Summary")
-        st.dataframe(summary_df, use_container_width=True)
+        st.table(summary_df)
         
         # Detailed analysis for a selected outcome
         st.subheader("Detailed Outcome Analysis")
@@ -696,7 +684,7 @@ def render_outcome_analysis(process_data, banks):
         
         # Create dataframe for display
         outcome_df = pd.DataFrame(outcome_processes)
-        st.dataframe(outcome_df, use_container_width=True)
+        st.table(outcome_df)
     
     with tab2:
         # Improvement Planning section with Benchmark Comparison
@@ -735,23 +723,9 @@ def render_outcome_analysis(process_data, banks):
         benchmark_avg = 0
         
         if selected_banks:
-            banks_data, _ = load_data()
-            
             for bank in selected_banks:
-                bank_data = banks_data.get(bank, {})
-                process_values = {}
-                
-                # Distribute stage scores across processes
-                for stage in range(1, 13):
-                    stage_processes = get_process_data_for_stage(stage)
-                    stage_score = bank_data.get(stage, 0)
-                    
-                    for process in stage_processes:
-                        process_values[process['qid']] = stage_score / len(stage_processes)
-                
-                # Calculate outcome score for this bank
-                bank_score = calculate_outcome_score(process_values, selected_outcome)
-                bank_scores[bank] = round(bank_score, 2)
+                # Outcome scores per bank are static, so they are precomputed in data_loader
+                bank_scores[bank] = round(get_bank_outcome_scores(bank)[selected_outcome], 2)
             
             # Calculate average benchmark score
             if bank_scores:
@@ -818,7 +792,7 @@ def render_outcome_analysis(process_data, banks):
         
         if implementation_data:
             implementation_df = pd.DataFrame(implementation_data)
-            st.dataframe(implementation_df, use_container_width=True)
+            st.table(implementation_df)
         
         # Improvement simulation
         st.subheader("Improvement Simulation")
@@ -843,27 +817,14 @@ def render_outcome_analysis(process_data, banks):
                 maturity_level = "Emerging"
             
             # Slider for improvement simulation
-            maturity_options = ["Basic", "Advanced", "Leading", "Emerging"]
-            current_index = maturity_options.index(maturity_level)
-            
             new_maturity = st.select_slider(
                 f"Improve {questions.get(pid, pid)}",
-                options=maturity_options,
+                options=list(MATURITY_SCORES),
                 value=maturity_level
             )
             
-            # Convert maturity level to score
-            if new_maturity == "Basic":
-                new_value = 0
-            elif new_maturity == "Advanced":
-                new_value = 0.33
-            elif new_maturity == "Leading":
-                new_value = 0.66
-            else:  # Emerging
-                new_value = 1.0
-            
             # Update simulation data
-            simulation_data[pid] = new_value
+            simulation_data[pid] = MATURITY_SCORES[new_maturity]
         
         # Calculate new score
         new_score = calculate_outcome_score(simulation_data, selected_outcome)
@@ -924,7 +885,7 @@ def render_outcome_analysis(process_data, banks):
         })
         
         # Sort by score in descending order
-        comparison_df = comparison_df.sort_values("Score", ascending=False)
+        comparison_df.sort_values("Score", ascending=False, ignore_index=True, kind="stable", inplace=True)
         
         # Create bar chart
         fig = px.bar(
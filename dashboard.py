@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from business_data import load_process_details
+from business_data import load_process_details_df
 from data_loader import get_stage_names, KPI_MATRIX
 from visualization import create_radar_chart
 
@@ -402,10 +402,10 @@ def render_process_dependency_view():
     st.subheader("Process Dependency & Impact Analysis")
     
     # Create a simple dependency visualization
-    process_data = load_process_details()
+    process_df = load_process_details_df()
     
     # Select a process to analyze
-    process_options = [f"{p['qid']}: {p['process']}" for p in process_data]
+    process_options = (process_df.index + ": " + process_df["process"]).tolist()
     selected_process = st.selectbox(
         "Select Process for Dependency Analysis:",
         options=process_options
@@ -415,9 +415,9 @@ def render_process_dependency_view():
         process_id = selected_process.split(":")[0]
         
         # Find the process details
-        process_detail = next((p for p in process_data if p['qid'] == process_id), None)
+        process_detail = process_df.loc[process_id] if process_id in process_df.index else None
         
-        if process_detail:
+        if process_detail is not None:
             st.markdown(f"### {process_detail['process']}")
             st.write(process_detail['description'])
             
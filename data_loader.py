@@ -1,144 +1,304 @@
+import sys
+from collections import namedtuple
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
-import streamlit as st
-from business_data import load_process_details
-
-# KPI Matrix mapping for each process
-KPI_MATRIX = {
-    "1A": {"kpi": "Channel Transaction Success Rate (%)", "ppe_cap": "Lead PPE Cap: How PPE Engr Technical Solution Architects help Platform Mod Re-platform to Omni-channel"},
-    "1B": {"kpi": "Input Validation Error Rate (%)", "ppe_cap": "Agile Implem: Sprint team re Contextual auth rules Platform Mod Stand-up api-IBAM+/NPC+UPI"},
-    "1C": {"kpi": "Input Validation Error Rate (%)", "ppe_cap": "Program Debt: Deliver Kafka/Event-stream for data-masking Edge Consult: Design Micro+: NuBank / Finclear"},
-    "1D": {"kpi": "Queue latency (ms) to hub", "ppe_cap": "Platform Mod Configure.io/a Transform.io ServiceNow C Low-code dev Camunda DM K8s"},
-    "2A": {"kpi": "Authentication Success Rate (%)", "ppe_cap": "Platform Mod: Deploy MTrO, takeover Kong + HSM ServiceNow C Build wired JJ UPath-bot, m/l rules w/BRMS"},
-    "2B": {"kpi": "Avg. Authentication Time (seconds)", "ppe_cap": "Regulated Ref: Replace code, Pega Decision Engine Program Debt: Integrate AM for Silent Edge / OCR"},
-    "2C": {"kpi": "Fraud blocked pre-auth (%)", "ppe_cap": "Platform Mod: Wire GeoPop for Azure OpenAI Agile Implem: ML 'payment' SageMaker data models"},
-    "2D": {"kpi": "% fraud-block-to-false-positive ratio", "ppe_cap": "Platform Mod: Smart router w Volante Smartfx/ Rapid Program Debt: Deliver new TCS Quartz hub"},
-    "3A": {"kpi": "Pre-Processing Rejection Rate (%)", "ppe_cap": "Regulated Ref: Implement SA-born Framwork for Mule APIs Platform Mod: Deploy gRPC FaaSLite cloud functions"},
-    "3B": {"kpi": "Accuracy", "ppe_cap": "Program Debt: Integrate 'Outer Quantum + AR services' Edge Consult: Real-time Between-the-lines Graph DB"},
-    "3C": {"kpi": "Fraud Detection Rate (%) & Fraud False Positive Rate (%)", "ppe_cap": "ServiceNow C: Configure IVS GenNext/wt/ Edge Graph ServiceNow C: Rapid UX node Twilio Verify QR verify"},
-    "3D": {"kpi": "Sanctions Screening STP Rate (%) / Avg. Alert/Case Resolution Time (hours)", "ppe_cap": "Salesforce CC: Rapid UX node Tw/Vo Verify QR verify Platform Mod: Event API brkr Finastra Event Manager"},
-    "4A": {"kpi": "Optimized fee per tx (USD)", "ppe_cap": "Regulated Ref: Implement re-Containterized TPE Platform Mod: Containerized SWIFT Trans/hub"},
-    "4B": {"kpi": "Cut-off Miss Rate (%)", "ppe_cap": "Program Debt: Integrate GE Ref-data quick-change Platform Mod: Auto-split rule MuleaSoft transa"},
-    "4C": {"kpi": "Real-time fraud detection F-score", "ppe_cap": "Platform Mod Expose Kafka & UPath-as Service"},
-    "4D": {"kpi": "Mean repair handling time", "ppe_cap": "Platform Mod: Replace dev'd IBM MQ on Openshift Platform Mod: K8S IPA auto- Kubernetes Archs"},
-    "5A": {"kpi": "Fraud Detection Rate (%) & Fraud False Positive Rate (%)", "ppe_cap": "SalesForce Cx: Track UETR / (z SWIFT gpi, Grids) Platform Mod: Web/host Auto AWS transit/block"},
-    "5B": {"kpi": "Sanctions Screening STP Rate (%)", "ppe_cap": "Platform Mod: Real-time hub Fusion-MLM, prebuilt Program Debt: Migrate to SA+ Cloud proxy auth/Okt"},
-    "5C": {"kpi": "PEP / AML Compliance Rate", "ppe_cap": "Platform Mod: Treasury user t GITB cash-fold auto (No native PPE --- ONLY remote expert)"},
-    "5D": {"kpi": "Avg. Time in Pre-Processing Repair (hours)", "ppe_cap": "ServiceNow C: Reconciliation Duo/BlueLight /Redline MS Dynamics Event-driven + Kafka + Dynamo DB"},
-    "6A": {"kpi": "Authorization Turnaround Time (Avg. hours/minutes)", "ppe_cap": "ServiceNow C: Auto-rebill EF Pega BPM / RPA SalesForce Cx: Self-service ops.gw API + Tw. Flex + S"},
-    "6B": {"kpi": "Post-Processing Authorization Rejection Rate (%)", "ppe_cap": "MS Dynamics On-demand B-Away API Message bus Platform Mod: Stream to Splk Kafka + Snowfl"},
-    "6C": {"kpi": "Operational Loss Reduction", "ppe_cap": "SalesForce Cx: GraphQL suite Graph-D + Logs-D Platform Mod: Immutable AA AWS QLDB, Vertica"},
-    "6D": {"kpi": "Compliance Rate", "ppe_cap": "Program Debt: Cloud Guard Vault StrucLed SMS ServiceNow C: RegTech e-Tran AxonIot, galxe/Ov"},
-    "7A": {"kpi": "Message Formatting/Mapping STP Rate (%)", "ppe_cap": "MS Dynamics Secure smart SmartView SlaS"},
-    "7B": {"kpi": "Avg. Time in Mapping/Formatter Repair Queue (hours)", "ppe_cap": ""},
-    "7C": {"kpi": "% data loss events logged", "ppe_cap": ""},
-    "7D": {"kpi": "Mean repair handling time", "ppe_cap": ""},
-    "8A": {"kpi": "Clearing Network Success Rate (%)", "ppe_cap": ""},
-    "8B": {"kpi": "End-to-End Payment Latency (Avg. hours/minutes)", "ppe_cap": ""},
-    "8C": {"kpi": "Activity Execution on-time", "ppe_cap": ""},
-    "8D": {"kpi": "Throughput", "ppe_cap": ""},
-    "9A": {"kpi": "On-Time Settlement Rate (%)", "ppe_cap": ""},
-    "9B": {"kpi": "Exact Settlement Rate (%)", "ppe_cap": ""},
-    "9C": {"kpi": "Intraday Liquidity Buffer Usage (%) / Cost (bps)", "ppe_cap": ""},
-    "9D": {"kpi": "Operational Loss Reduction", "ppe_cap": ""},
-    "10A": {"kpi": "Reconciliation Auto-Match Rate (%)", "ppe_cap": ""},
-    "10B": {"kpi": "Avg. Age of Open Reconciliation Break Items (days)", "ppe_cap": ""},
-    "10C": {"kpi": "Value of Unreconciled Items ($/€/₹)", "ppe_cap": ""},
-    "10D": {"kpi": "Net-Promoter Score", "ppe_cap": ""},
-    "11A": {"kpi": "Data Latency for Key Reports/Dashboards (Avg. minutes/hours)", "ppe_cap": ""},
-    "11B": {"kpi": "Client Self-Service Reporting Usage Rate (%)", "ppe_cap": ""},
-    "11C": {"kpi": "Productivity (cross-sell)", "ppe_cap": ""},
-    "11D": {"kpi": "Net-Promoter Score", "ppe_cap": ""},
-    "12A": {"kpi": "Regulatory Reporting Accuracy / Timeliness Rate (%)", "ppe_cap": ""},
-    "12B": {"kpi": "Avg. Time to Retrieve Archived Transaction Data (hours/days)", "ppe_cap": ""},
-    "12C": {"kpi": "Compliance Rate", "ppe_cap": ""},
-    "12D": {"kpi": "Compliance Rate", "ppe_cap": ""}
+from business_data import rows_for_stage
+from business_outcomes_mapper import create_outcome_radar_data
+
+# KPI Matrix mapping for each process, stored as parallel tuples indexed by process code
+_KPI_CODES = (
+    "1A", "1B", "1C", "1D",
+    "2A", "2B", "2C", "2D",
+    "3A", "3B", "3C", "3D",
+    "4A", "4B", "4C", "4D",
+    "5A", "5B", "5C", "5D",
+    "6A", "6B", "6C", "6D",
+    "7A", "7B", "7C", "7D",
+    "8A", "8B", "8C", "8D",
+    "9A", "9B", "9C", "9D",
+    "10A", "10B", "10C", "10D",
+    "11A", "11B", "11C", "11D",
+    "12A", "12B", "12C", "12D",
+)
+_KPI = (
+    "Channel Transaction Success Rate (%)",  # 1A
+    "Input Validation Error Rate (%)",  # 1B
+    "Input Validation Error Rate (%)",  # 1C
+    "Queue latency (ms) to hub",  # 1D
+    "Authentication Success Rate (%)",  # 2A
+    "Avg. Authentication Time (seconds)",  # 2B
+    "Fraud blocked pre-auth (%)",  # 2C
+    "% fraud-block-to-false-positive ratio",  # 2D
+    "Pre-Processing Rejection Rate (%)",  # 3A
+    "Accuracy",  # 3B
+    "Fraud Detection Rate (%) & Fraud False Positive Rate (%)",  # 3C
+    "Sanctions Screening STP Rate (%) / Avg. Alert/Case Resolution Time (hours)",  # 3D
+    "Optimized fee per tx (USD)",  # 4A
+    "Cut-off Miss Rate (%)",  # 4B
+    "Real-time fraud detection F-score",  # 4C
+    "Mean repair handling time",  # 4D
+    "Fraud Detection Rate (%) & Fraud False Positive Rate (%)",  # 5A
+    "Sanctions Screening STP Rate (%)",  # 5B
+    "PEP / AML Compliance Rate",  # 5C
+    "Avg. Time in Pre-Processing Repair (hours)",  # 5D
+    "Authorization Turnaround Time (Avg. hours/minutes)",  # 6A
+    "Post-Processing Authorization Rejection Rate (%)",  # 6B
+    "Operational Loss Reduction",  # 6C
+    "Compliance Rate",  # 6D
+    "Message Formatting/Mapping STP Rate (%)",  # 7A
+    "Avg. Time in Mapping/Formatter Repair Queue (hours)",  # 7B
+    "% data loss events logged",  # 7C
+    "Mean repair handling time",  # 7D
+    "Clearing Network Success Rate (%)",  # 8A
+    "End-to-End Payment Latency (Avg. hours/minutes)",  # 8B
+    "Activity Execution on-time",  # 8C
+    "Throughput",  # 8D
+    "On-Time Settlement Rate (%)",  # 9A
+    "Exact Settlement Rate (%)",  # 9B
+    "Intraday Liquidity Buffer Usage (%) / Cost (bps)",  # 9C
+    "Operational Loss Reduction",  # 9D
+    "Reconciliation Auto-Match Rate (%)",  # 10A
+    "Avg. Age of Open Reconciliation Break Items (days)",  # 10B
+    "Value of Unreconciled Items ($/€/₹)",  # 10C
+    "Net-Promoter Score",  # 10D
+    "Data Latency for Key Reports/Dashboards (Avg. minutes/hours)",  # 11A
+    "Client Self-Service Reporting Usage Rate (%)",  # 11B
+    "Productivity (cross-sell)",  # 11C
+    "Net-Promoter Score",  # 11D
+    "Regulatory Reporting Accuracy / Timeliness Rate (%)",  # 12A
+    "Avg. Time to Retrieve Archived Transaction Data (hours/days)",  # 12B
+    "Compliance Rate",  # 12C
+    "Compliance Rate",  # 12D
+)
+_PPE = (
+    "Lead PPE Cap: How PPE Engr Technical Solution Architects help Platform Mod Re-platform to Omni-channel",  # 1A
+    "Agile Implem: Sprint team re Contextual auth rules Platform Mod Stand-up api-IBAM+/NPC+UPI",  # 1B
+    "Program Debt: Deliver Kafka/Event-stream for data-masking Edge Consult: Design Micro+: NuBank / Finclear",  # 1C
+    "Platform Mod Configure.io/a Transform.io ServiceNow C Low-code dev Camunda DM K8s",  # 1D
+    "Platform Mod: Deploy MTrO, takeover Kong + HSM ServiceNow C Build wired JJ UPath-bot, m/l rules w/BRMS",  # 2A
+    "Regulated Ref: Replace code, Pega Decision Engine Program Debt: Integrate AM for Silent Edge / OCR",  # 2B
+    "Platform Mod: Wire GeoPop for Azure OpenAI Agile Implem: ML 'payment' SageMaker data models",  # 2C
+    "Platform Mod: Smart router w Volante Smartfx/ Rapid Program Debt: Deliver new TCS Quartz hub",  # 2D
+    "Regulated Ref: Implement SA-born Framwork for Mule APIs Platform Mod: Deploy gRPC FaaSLite cloud functions",  # 3A
+    "Program Debt: Integrate 'Outer Quantum + AR services' Edge Consult: Real-time Between-the-lines Graph DB",  # 3B
+    "ServiceNow C: Configure IVS GenNext/wt/ Edge Graph ServiceNow C: Rapid UX node Twilio Verify QR verify",  # 3C
+    "Salesforce CC: Rapid UX node Tw/Vo Verify QR verify Platform Mod: Event API brkr Finastra Event Manager",  # 3D
+    "Regulated Ref: Implement re-Containterized TPE Platform Mod: Containerized SWIFT Trans/hub",  # 4A
+    "Program Debt: Integrate GE Ref-data quick-change Platform Mod: Auto-split rule MuleaSoft transa",  # 4B
+    "Platform Mod Expose Kafka & UPath-as Service",  # 4C
+    "Platform Mod: Replace dev'd IBM MQ on Openshift Platform Mod: K8S IPA auto- Kubernetes Archs",  # 4D
+    "SalesForce Cx: Track UETR / (z SWIFT gpi, Grids) Platform Mod: Web/host Auto AWS transit/block",  # 5A
+    "Platform Mod: Real-time hub Fusion-MLM, prebuilt Program Debt: Migrate to SA+ Cloud proxy auth/Okt",  # 5B
+    "Platform Mod: Treasury user t GITB cash-fold auto (No native PPE --- ONLY remote expert)",  # 5C
+    "ServiceNow C: Reconciliation Duo/BlueLight /Redline MS Dynamics Event-driven + Kafka + Dynamo DB",  # 5D
+    "ServiceNow C: Auto-rebill EF Pega BPM / RPA SalesForce Cx: Self-service ops.gw API + Tw. Flex + S",  # 6A
+    "MS Dynamics On-demand B-Away API Message bus Platform Mod: Stream to Splk Kafka + Snowfl",  # 6B
+    "SalesForce Cx: GraphQL suite Graph-D + Logs-D Platform Mod: Immutable AA AWS QLDB, Vertica",  # 6C
+    "Program Debt: Cloud Guard Vault StrucLed SMS ServiceNow C: RegTech e-Tran AxonIot, galxe/Ov",  # 6D
+    "MS Dynamics Secure smart SmartView SlaS",  # 7A
+    "",  # 7B
+    "",  # 7C
+    "",  # 7D
+    "",  # 8A
+    "",  # 8B
+    "",  # 8C
+    "",  # 8D
+    "",  # 9A
+    "",  # 9B
+    "",  # 9C
+    "",  # 9D
+    "",  # 10A
+    "",  # 10B
+    "",  # 10C
+    "",  # 10D
+    "",  # 11A
+    "",  # 11B
+    "",  # 11C
+    "",  # 11D
+    "",  # 12A
+    "",  # 12B
+    "",  # 12C
+    "",  # 12D
+)
+# Intern repeated KPI and PPE strings so equal entries share a single object
+_KPI = tuple(sys.intern(kpi) for kpi in _KPI)
+_PPE = tuple(sys.intern(ppe) for ppe in _PPE)
+_KEY_IDX = {code: i for i, code in enumerate(_KPI_CODES)}
+
+# KPI entry for a single process
+KPI = namedtuple("KPI", ("kpi", "ppe_cap"))
+
+# KPI matrix keyed by process code, for existing importers
+KPI_MATRIX = {code: KPI(_KPI[i], _PPE[i]) for code, i in _KEY_IDX.items()}
+
+# Benchmark data for different banks, based on the provided images.
+# Built once at import; the helpers below return references to it.
+_DATA = {
+    "JPMC (Global)": {
+        1: 3.32, 2: 3.32, 3: 2.64, 4: 2.64, 5: 3.66, 6: 2.64, 
+        7: 1.98, 8: 3.66, 9: 4, 10: 2.64, 11: 3.66, 12: 2.64,
+        "Overall": 3.04
+    },
+    "DBS (Asia)": {
+        1: 3.32, 2: 2.66, 3: 2.66, 4: 2.66, 5: 3.32, 6: 2.66, 
+        7: 2.66, 8: 3.32, 9: 3.32, 10: 1.98, 11: 2.66, 12: 1.98,
+        "Overall": 2.85
+    },
+    "HSBC (Wholesale)": {
+        1: 3.32, 2: 2.66, 3: 1.98, 4: 2.66, 5: 3.32, 6: 2.66, 
+        7: 2.66, 8: 3.32, 9: 2.66, 10: 1.98, 11: 2.66, 12: 1.98,
+        "Overall": 2.72
+    },
+    "HDFC (India)": {
+        1: 2.66, 2: 2.66, 3: 1.98, 4: 1.98, 5: 2.66, 6: 1.98, 
+        7: 1.98, 8: 2.66, 9: 2.66, 10: 1.98, 11: 1.98, 12: 1.32,
+        "Overall": 2.3
+    },
+    "SBI (Scale)": {
+        1: 2.66, 2: 1.98, 3: 1.32, 4: 1.98, 5: 1.98, 6: 1.98, 
+        7: 1.98, 8: 2.66, 9: 2.66, 10: 1.32, 11: 1.32, 12: 1.32,
+        "Overall": 1.89
+    },
+    "ICICI Bank": {
+        1: 3.32, 2: 2.64, 3: 1.32, 4: 1.32, 5: 2.64, 6: 2.64, 
+        7: 1.32, 8: 2.64, 9: 2.64, 10: 1.32, 11: 1.32, 12: 1.32,
+        "Overall": 1.95
+    }
 }
 
+# Mapping of stage names for reference
+_STAGE_NAMES_TUP = (
+    "Payment Initiation & Data Capture",
+    "Authentication & Identity Validation",
+    "Pre-Submission Validation",
+    "Payment Orchestration & Routing",
+    "Risk, Fraud & Compliance",
+    "Final Authorisation & Approval",
+    "Message Generation & Transformation",
+    "Transmission, Clearing & ACK",
+    "Settlement & Funds Movement",
+    "Reconciliation & Exceptions",
+    "Reporting, Analytics & Notifications",
+    "Audit, Archival & Compliance"
+)
+# Intern the stage names so lookups keyed by process stage hit on identity
+_STAGE_NAMES_TUP = tuple(sys.intern(name) for name in _STAGE_NAMES_TUP)
+# Read-only view of the stage names keyed by stage ID, for existing callers
+_STAGE_NAMES = MappingProxyType({i + 1: name for i, name in enumerate(_STAGE_NAMES_TUP)})
+# Read-only reverse lookup from stage name to stage ID
+STAGE_TO_ID = MappingProxyType({name: i + 1 for i, name in enumerate(_STAGE_NAMES_TUP)})
+
+# Read-only view of the benchmark data and of each bank's scores, shared with callers without copying
+_DATA_FROZEN = MappingProxyType({bank: MappingProxyType(scores) for bank, scores in _DATA.items()})
+
+# Columnar view of the benchmark data: one row per bank, one column per stage.
+# Stored column-major since most aggregations slice a stage across banks.
+BANK_NAMES = tuple(_DATA)
+BANK_INDEX = {bank: i for i, bank in enumerate(BANK_NAMES)}
+_BANK_STAGE_SCORES = np.array(
+    [[_DATA[bank][sid] for sid in range(1, 13)] for bank in BANK_NAMES],
+    order="F"
+)
+_BANK_OVERALL = np.array([_DATA[bank]["Overall"] for bank in BANK_NAMES])
+_BANK_STAGE_SCORES.flags.writeable = False
+_BANK_OVERALL.flags.writeable = False
+
+def get_bank_score_matrix():
+    """
+    Get the benchmark scores of every bank as read-only arrays
+    
+    Returns:
+    - Tuple of (bank x stage score matrix, overall score per bank), with rows in BANK_NAMES order
+    """
+    return _BANK_STAGE_SCORES, _BANK_OVERALL
+
 # Load the benchmark data from the provided images
 def load_data():
     """
     Load and process the benchmark data for different banks
-    """
-    # Create data structure based on the provided images
-    data = {
-        "JPMC (Global)": {
-            1: 3.32, 2: 3.32, 3: 2.64, 4: 2.64, 5: 3.66, 6: 2.64, 
-            7: 1.98, 8: 3.66, 9: 4, 10: 2.64, 11: 3.66, 12: 2.64,
-            "Overall": 3.04
-        },
-        "DBS (Asia)": {
-            1: 3.32, 2: 2.66, 3: 2.66, 4: 2.66, 5: 3.32, 6: 2.66, 
-            7: 2.66, 8: 3.32, 9: 3.32, 10: 1.98, 11: 2.66, 12: 1.98,
-            "Overall": 2.85
-        },
-        "HSBC (Wholesale)": {
-            1: 3.32, 2: 2.66, 3: 1.98, 4: 2.66, 5: 3.32, 6: 2.66, 
-            7: 2.66, 8: 3.32, 9: 2.66, 10: 1.98, 11: 2.66, 12: 1.98,
-            "Overall": 2.72
-        },
-        "HDFC (India)": {
-            1: 2.66, 2: 2.66, 3: 1.98, 4: 1.98, 5: 2.66, 6: 1.98, 
-            7: 1.98, 8: 2.66, 9: 2.66, 10: 1.98, 11: 1.98, 12: 1.32,
-            "Overall": 2.3
-        },
-        "SBI (Scale)": {
-            1: 2.66, 2: 1.98, 3: 1.32, 4: 1.98, 5: 1.98, 6: 1.98, 
-            7: 1.98, 8: 2.66, 9: 2.66, 10: 1.32, 11: 1.32, 12: 1.32,
-            "Overall": 1.89
-        },
-        "ICICI Bank": {
-            1: 3.32, 2: 2.64, 3: 1.32, 4: 1.32, 5: 2.64, 6: 2.64, 
-            7: 1.32, 8: 2.64, 9: 2.64, 10: 1.32, 11: 1.32, 12: 1.32,
-            "Overall": 1.95
-        }
-    }
-    
-    # Also create a mapping of stage names for reference
-    stage_names = {
-        1: "Payment Initiation & Data Capture",
-        2: "Authentication & Identity Validation",
-        3: "Pre-Submission Validation",
-        4: "Payment Orchestration & Routing",
-        5: "Risk, Fraud & Compliance",
-        6: "Final Authorisation & Approval",
-        7: "Message Generation & Transformation",
-        8: "Transmission, Clearing & ACK",
-        9: "Settlement & Funds Movement",
-        10: "Reconciliation & Exceptions",
-        11: "Reporting, Analytics & Notifications",
-        12: "Audit, Archival & Compliance"
-    }
     
-    return data, stage_names
+    Returns:
+    - Tuple of (read-only scores by bank, stage names by stage ID)
+    """
+    return _DATA_FROZEN, _STAGE_NAMES
 
 def get_bank_names():
-    """Returns list of bank names from the benchmark data"""
-    data, _ = load_data()
-    return list(data.keys())
+    """Returns the bank names from the benchmark data as an immutable tuple"""
+    return BANK_NAMES
 
 def get_bank_scores(bank_name):
-    """Returns the scores for a specific bank"""
-    data, _ = load_data()
-    if bank_name in data:
-        return data[bank_name]
-    return None
+    """Returns the read-only scores for a specific bank"""
+    return _DATA_FROZEN.get(bank_name)
 
 def get_stage_names():
     """Returns mapping of stage IDs to names"""
-    _, stage_names = load_data()
-    return stage_names
+    return _STAGE_NAMES
+
+def get_stage_id(stage_name):
+    """Returns the stage ID for a stage name, or None if unknown"""
+    return STAGE_TO_ID.get(stage_name)
 
 def get_process_data_for_stage(stage_id):
     """Returns process data for a specific stage"""
-    process_data = load_process_details()
-    return [p for p in process_data if p['stage'].startswith(get_stage_names()[stage_id])]
+    return rows_for_stage(_STAGE_NAMES_TUP[stage_id - 1])
+
+# Fixed category set for process IDs in assessment frames
+_PROCESS_CATS = pd.CategoricalDtype(categories=_KPI_CODES, ordered=False)
 
 def create_assessment_dataframe(assessment_data):
     """Convert assessment data to DataFrame for analysis"""
-    data = []
-    for process_id, score in assessment_data.items():
-        data.append({
-            "Process ID": process_id,
-            "Score": score
-        })
-    return pd.DataFrame(data)
+    process_ids = list(assessment_data)
+    scores = np.fromiter(assessment_data.values(), dtype=float, count=len(assessment_data))
+    # Known process codes are stored as categories; any other IDs are kept as given
+    if all(_KEY_IDX.get(qid) is not None for qid in process_ids):
+        process_ids = pd.Categorical(process_ids, dtype=_PROCESS_CATS)
+    return pd.DataFrame({
+        "Process ID": process_ids,
+        "Score": scores
+    })
+
+# Precomputed per-stage process lookups, built once at import from the cached helper
+STAGE_PROCESSES = {sid: get_process_data_for_stage(sid) for sid in range(1, 13)}
+STAGE_PROCESS_IDS = {sid: tuple(p.qid for p in STAGE_PROCESSES[sid]) for sid in range(1, 13)}
+STAGE_SIZES = np.array([len(STAGE_PROCESS_IDS[sid]) for sid in range(1, 13)])
+
+# Stage of each process as a Categorical, for integer-coded groupby of process scores
+QIDS = [qid for sid in range(1, 13) for qid in STAGE_PROCESS_IDS[sid]]
+QID_STAGE_CAT = pd.Series(
+    pd.Categorical([sid for sid in range(1, 13) for _ in STAGE_PROCESS_IDS[sid]]),
+    index=QIDS
+)
+
+def _outcome_scores(process_values):
+    """Returns a read-only mapping of business outcome to score for a set of process scores"""
+    return MappingProxyType({o["Outcome"]: o["Score"] for o in create_outcome_radar_data(process_values)})
+
+# Each bank's stage scores distributed evenly across the stage's processes (simplified approach),
+# as one read-only bank x process array in BANK_NAMES / QIDS order
+_BANK_PROCESS_SCORES = np.repeat(_BANK_STAGE_SCORES / STAGE_SIZES, STAGE_SIZES, axis=1)
+_BANK_PROCESS_SCORES.flags.writeable = False
+
+# Per-bank process and outcome scores are static, so they are built once at import
+_BANK_PROCESS_VALUES = {
+    bank: MappingProxyType(dict(zip(QIDS, _BANK_PROCESS_SCORES[i].tolist()))) for bank, i in BANK_INDEX.items()
+}
+_BANK_OUTCOME_SCORES = {bank: _outcome_scores(values) for bank, values in _BANK_PROCESS_VALUES.items()}
+_ZERO_PROCESS_VALUES = MappingProxyType(dict.fromkeys(QIDS, 0.0))
+_ZERO_OUTCOME_SCORES = _outcome_scores(_ZERO_PROCESS_VALUES)
+
+def get_bank_process_values(bank_name):
+    """
+    Get a benchmark bank's stage scores distributed evenly across the stage's processes
+    
+    Parameters:
+    - bank_name: Name of the benchmark bank
+    
+    Returns:
+    - Read-only mapping of process IDs to scores, all 0.0 for an unknown bank
+    """
+    return _BANK_PROCESS_VALUES.get(bank_name, _ZERO_PROCESS_VALUES)
+
+def get_bank_outcome_scores(bank_name):
+    """Returns a read-only mapping of business outcome to score for a benchmark bank"""
+    return _BANK_OUTCOME_SCORES.get(bank_name, _ZERO_OUTCOME_SCORES)
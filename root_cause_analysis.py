@@ -4,7 +4,7 @@ import plotly.graph_objects as go
 import networkx as nx
 import plotly.figure_factory as ff
 import random
-from business_data import load_process_details
+from business_data import load_process_table, PROCESS_NAMES
 from data_loader import get_stage_names, KPI_MATRIX
 
 # Load upstream process dependencies from the provided data
@@ -71,13 +71,16 @@ UPSTREAM_DEPENDENCIES = {
     "12D": ["12A", "12B"]
 }
 
-# Map process IDs to their names for better readability
-def get_process_names():
-    process_data = load_process_details()
-    process_names = {}
-    for process in process_data:
-        process_names[process['qid']] = process['process']
-    return process_names
+def _build_downstream_dependencies(upstream_dependencies):
+    """Returns the reverse index of the dependencies: process ID -> processes that depend on it"""
+    downstream = {}
+    for target_pid, deps in upstream_dependencies.items():
+        for dep_pid in deps:
+            downstream.setdefault(dep_pid, []).append(target_pid)
+    return downstream
+
+# Reverse index of the dependencies, built once at import
+DOWNSTREAM_DEPENDENCIES = _build_downstream_dependencies(UPSTREAM_DEPENDENCIES)
 
 # Generate mock status data for processes
 def generate_mock_status(process_ids, target_problem_areas=None):
@@ -104,13 +107,14 @@ def generate_mock_status(process_ids, target_problem_areas=None):
     
     # Override with target problem areas if specified
     if target_problem_areas:
+        process_id_set = set(process_ids)
         for pid in target_problem_areas:
-            if pid in process_ids:
+            if pid in process_id_set:
                 status_data[pid] = 'red'
                 
                 # Find upstream dependencies and mark some as amber/red
-                for upstream_pid, deps in UPSTREAM_DEPENDENCIES.items():
-                    if pid in deps and upstream_pid in process_ids:
+                for upstream_pid in DOWNSTREAM_DEPENDENCIES.get(pid, []):
+                    if upstream_pid in process_id_set:
                         # 50% chance to make upstream nodes amber
                         status_data[upstream_pid] = random.choices(
                             ['amber', 'red'], 
@@ -136,7 +140,7 @@ def build_dependency_graph(process_ids, status_data, reverse=False):
     G = nx.DiGraph()
     
     # Add nodes with their status
-    process_names = get_process_names()
+    process_names = PROCESS_NAMES
     for pid in process_ids:
         if pid in process_names:
             # Add node with display name and status
@@ -146,18 +150,19 @@ def build_dependency_graph(process_ids, status_data, reverse=False):
             G.add_node(pid, name=pid, status=status_data.get(pid, 'grey'))
     
     # Add edges based on dependencies
+    process_id_set = set(process_ids)
     if reverse:
         # Add upstream dependencies (what affects this process)
         for pid in process_ids:
             if pid in UPSTREAM_DEPENDENCIES:
                 for dep_pid in UPSTREAM_DEPENDENCIES[pid]:
-                    if dep_pid in process_ids:
+                    if dep_pid in process_id_set:
                         G.add_edge(dep_pid, pid)
     else:
         # Add downstream dependencies (what this process affects)
         for pid in process_ids:
-            for target_pid, deps in UPSTREAM_DEPENDENCIES.items():
-                if pid in deps and target_pid in process_ids:
+            for target_pid in DOWNSTREAM_DEPENDENCIES.get(pid, []):
+                if target_pid in process_id_set:
                     G.add_edge(pid, target_pid)
     
     return G
@@ -291,8 +296,9 @@ def map_processes_to_kpis(processes):
     process_kpis = {}
     
     for pid in processes:
-        if pid in KPI_MATRIX:
-            process_kpis[pid] = KPI_MATRIX[pid]["kpi"]
+        entry = KPI_MATRIX.get(pid)
+        if entry is not None:
+            process_kpis[pid] = entry.kpi
     
     return process_kpis
 
@@ -309,7 +315,7 @@ def create_process_journey_figure(status_data):
     """
     # Group processes by stage
     stages = {}
-    process_names = get_process_names()
+    process_names = PROCESS_NAMES
     
     for pid in status_data:
         stage_id = int(pid[0]) if pid[0].isdigit() else 0
@@ -453,8 +459,7 @@ def render_root_cause_analysis():
     st.session_state.rca_scenario = selected_scenario
     
     # Get all process IDs
-    process_data = load_process_details()
-    all_process_ids = [p['qid'] for p in process_data]
+    all_process_ids = list(load_process_table().qids)
     
     # Scenario-specific problem areas
     scenario_problems = {
@@ -478,7 +483,7 @@ def render_root_cause_analysis():
             "Select problematic processes:",
             options=all_process_ids,
             default=st.session_state.problem_processes,
-            format_func=lambda x: f"{x}: {get_process_names().get(x, 'Unknown')}"
+            format_func=lambda x: f"{x}: {PROCESS_NAMES.get(x, 'Unknown')}"
         )
         
         # Generate status data
@@ -523,7 +528,7 @@ def render_root_cause_analysis():
         focus_process = st.selectbox(
             "Select process to analyze dependencies:",
             options=st.session_state.problem_processes,
-            format_func=lambda x: f"{x}: {get_process_names().get(x, 'Unknown')}"
+            format_func=lambda x: f"{x}: {PROCESS_NAMES.get(x, 'Unknown')}"
         )
         
         if focus_process:
@@ -538,7 +543,7 @@ def render_root_cause_analysis():
                     if dep in st.session_state.status_data:
                         status = st.session_state.status_data[dep]
                         status_emoji = {"green": "🟢", "amber": "🟠", "red": "🔴"}.get(status, "⚪")
-                        process_name = get_process_names().get(dep, dep)
+                        process_name = PROCESS_NAMES.get(dep, dep)
                         st.write(f"{status_emoji} {dep}: {process_name}")
                     else:
                         st.write(f"⚪ {dep}")
@@ -547,16 +552,13 @@ def render_root_cause_analysis():
                 st.markdown("#### Downstream Impact")
                 st.write("Processes affected by this process:")
                 
-                downstream_processes = []
-                for target_pid, deps in UPSTREAM_DEPENDENCIES.items():
-                    if focus_process in deps:
-                        downstream_processes.append(target_pid)
+                downstream_processes = DOWNSTREAM_DEPENDENCIES.get(focus_process, [])
                 
                 for target in downstream_processes:
                     if target in st.session_state.status_data:
                         status = st.session_state.status_data[target]
                         status_emoji = {"green": "🟢", "amber": "🟠", "red": "🔴"}.get(status, "⚪")
-                        process_name = get_process_names().get(target, target)
+                        process_name = PROCESS_NAMES.get(target, target)
                         st.write(f"{status_emoji} {target}: {process_name}")
             
             # Create dependency graph visualization
@@ -587,7 +589,7 @@ def render_root_cause_analysis():
         root_causes = find_root_causes(st.session_state.problem_processes, depth=3)
         
         for problem_process in st.session_state.problem_processes:
-            with st.expander(f"Root Cause Analysis: {problem_process} - {get_process_names().get(problem_process, 'Unknown')}"):
+            with st.expander(f"Root Cause Analysis: {problem_process} - {PROCESS_NAMES.get(problem_process, 'Unknown')}"):
                 causes = root_causes.get(problem_process, [])
                 
                 if causes:
@@ -597,7 +599,7 @@ def render_root_cause_analysis():
                         if cause in st.session_state.status_data:
                             status = st.session_state.status_data[cause]
                             status_emoji = {"green": "🟢", "amber": "🟠", "red": "🔴"}.get(status, "⚪")
-                            process_name = get_process_names().get(cause, cause)
+                            process_name = PROCESS_NAMES.get(cause, cause)
                             
                             # Highlight problematic upstream processes
                             if status in ['red', 'amber']:
@@ -631,7 +633,7 @@ def render_root_cause_analysis():
         
         kpi_df_data = []
         for process_id, kpi in process_kpis.items():
-            process_name = get_process_names().get(process_id, 'Unknown')
+            process_name = PROCESS_NAMES.get(process_id, 'Unknown')
             status = st.session_state.status_data.get(process_id, 'unknown')
             
             kpi_df_data.append({
@@ -735,7 +737,7 @@ import plotly.graph_objects as go
 import networkx as nx
 import plotly.figure_factory as ff
 import random
-from business_data import load_process_details
+from business_data import load_process_table, PROCESS_NAMES
 from data_loader import get_stage_names, KPI_MATRIX
 
 # Load upstream process dependencies from the provided data
@@ -802,13 +804,16 @@ UPSTREAM_DEPENDENCIES = {
     "12D": ["12A", "12B"]
 }
 
-# Map process IDs to their names for better readability
-def get_process_names():
-    process_data = load_process_details()
-    process_names = {}
-    for process in process_data:
-        process_names[process['qid']] = process['process']
-    return process_names
+def _build_downstream_dependencies(upstream_dependencies):
+    """Returns the reverse index of the dependencies: process ID -> processes that depend on it"""
+    downstream = {}
+    for target_pid, deps in upstream_dependencies.items():
+        for dep_pid in deps:
+            downstream.setdefault(dep_pid, []).append(target_pid)
+    return downstream
+
+# Reverse index of the dependencies, built once at import
+DOWNSTREAM_DEPENDENCIES = _build_downstream_dependencies(UPSTREAM_DEPENDENCIES)
 
 # Generate mock status data for processes
 def generate_mock_status(process_ids, target_problem_areas=None):
@@ -835,13 +840,14 @@ def generate_mock_status(process_ids, target_problem_areas=None):
     
     # Override with target problem areas if specified
     if target_problem_areas:
+        process_id_set = set(process_ids)
         for pid in target_problem_areas:
-            if pid in process_ids:
+            if pid in process_id_set:
                 status_data[pid] = 'red'
                 
                 # Find upstream dependencies and mark some as amber/red
-                for upstream_pid, deps in UPSTREAM_DEPENDENCIES.items():
-                    if pid in deps and upstream_pid in process_ids:
+                for upstream_pid in DOWNSTREAM_DEPENDENCIES.get(pid, []):
+                    if upstream_pid in process_id_set:
                         # 50% chance to make upstream nodes amber
                         status_data[upstream_pid] = random.choices(
                             ['amber', 'red'], 
@@ -867,7 +873,7 @@ def build_dependency_graph(process_ids, status_data, reverse=False):
     G = nx.DiGraph()
     
     # Add nodes with their status
-    process_names = get_process_names()
+    process_names = PROCESS_NAMES
     for pid in process_ids:
         if pid in process_names:
             # Add node with display name and status
@@ -877,18 +883,19 @@ def build_dependency_graph(process_ids, status_data, reverse=False):
             G.add_node(pid, name=pid, status=status_data.get(pid, 'grey'))
     
     # Add edges based on dependencies
+    process_id_set = set(process_ids)
     if reverse:
         # Add upstream dependencies (what affects this process)
         for pid in process_ids:
             if pid in UPSTREAM_DEPENDENCIES:
                 for dep_pid in UPSTREAM_DEPENDENCIES[pid]:
-                    if dep_pid in process_ids:
+                    if dep_pid in process_id_set:
                         G.add_edge(dep_pid, pid)
     else:
         # Add downstream dependencies (what this process affects)
         for pid in process_ids:
-            for target_pid, deps in UPSTREAM_DEPENDENCIES.items():
-                if pid in deps and target_pid in process_ids:
+            for target_pid in DOWNSTREAM_DEPENDENCIES.get(pid, []):
+                if target_pid in process_id_set:
                     G.add_edge(pid, target_pid)
     
     return G
@@ -1022,8 +1029,9 @@ def map_processes_to_kpis(processes):
     process_kpis = {}
     
     for pid in processes:
-        if pid in KPI_MATRIX:
-            process_kpis[pid] = KPI_MATRIX[pid]["kpi"]
+        entry = KPI_MATRIX.get(pid)
+        if entry is not None:
+            process_kpis[pid] = entry.kpi
     
     return process_kpis
 
@@ -1040,7 +1048,7 @@ def create_process_journey_figure(status_data):
     """
     # Group processes by stage
     stages = {}
-    process_names = get_process_names()
+    process_names = PROCESS_NAMES
     
     for pid in status_data:
         stage_id = int(pid[0]) if pid[0].isdigit() else 0
@@ -1184,8 +1192,7 @@ def render_root_cause_analysis():
     st.session_state.rca_scenario = selected_scenario
     
     # Get all process IDs
-    process_data = load_process_details()
-    all_process_ids = [p['qid'] for p in process_data]
+    all_process_ids = list(load_process_table().qids)
     
     # Scenario-specific problem areas
     scenario_problems = {
@@ -1209,7 +1216,7 @@ def render_root_cause_analysis():
             "Select problematic processes:",
             options=all_process_ids,
             default=st.session_state.problem_processes,
-            format_func=lambda x: f"{x}: {get_process_names().get(x, 'Unknown')}"
+            format_func=lambda x: f"{x}: {PROCESS_NAMES.get(x, 'Unknown')}"
         )
         
         # Generate status data
@@ -1254,7 +1261,7 @@ def render_root_cause_analysis():
         focus_process = st.selectbox(
             "Select process to analyze dependencies:",
             options=st.session_state.problem_processes,
-            format_func=lambda x: f"{x}: {get_process_names().get(x, 'Unknown')}"
+            format_func=lambda x: f"{x}: {PROCESS_NAMES.get(x, 'Unknown')}"
         )
         
         if focus_process:
@@ -1269,7 +1276,7 @@ def render_root_cause_analysis():
                     if dep in st.session_state.status_data:
                         status = st.session_state.status_data[dep]
                         status_emoji = {"green": "🟢", "amber": "🟠", "red": "🔴"}.get(status, "⚪")
-                        process_name = get_process_names().get(dep, dep)
+                        process_name = PROCESS_NAMES.get(dep, dep)
                         st.write(f"{status_emoji} {dep}: {process_name}")
                     else:
                         st.write(f"⚪ {dep}")
@@ -1278,16 +1285,13 @@ def render_root_cause_analysis():
                 st.markdown("#### Downstream Impact")
                 st.write("Processes affected by this process:")
                 
-                downstream_processes = []
-                for target_pid, deps in UPSTREAM_DEPENDENCIES.items():
-                    if focus_process in deps:
-                        downstream_processes.append(target_pid)
+                downstream_processes = DOWNSTREAM_DEPENDENCIES.get(focus_process, [])
                 
                 for target in downstream_processes:
                     if target in st.session_state.status_data:
                         status = st.session_state.status_data[target]
                         status_emoji = {"green": "🟢", "amber": "🟠", "red": "🔴"}.get(status, "⚪")
-                        process_name = get_process_names().get(target, target)
+                        process_name = PROCESS_NAMES.get(target, target)
                         st.write(f"{status_emoji} {target}: {process_name}")
             
             # Create dependency graph visualization
@@ -1318,7 +1322,7 @@ def render_root_cause_analysis():
         root_causes = find_root_causes(st.session_state.problem_processes, depth=3)
         
         for problem_process in st.session_state.problem_processes:
-            with st.expander(f"Root Cause Analysis: {problem_process} - {get_process_names().get(problem_process, 'Unknown')}"):
+            with st.expander(f"Root Cause Analysis: {problem_process} - {PROCESS_NAMES.get(problem_process, 'Unknown')}"):
                 causes = root_causes.get(problem_process, [])
                 
                 if causes:
@@ -1328,7 +1332,7 @@ def render_root_cause_analysis():
                         if cause in st.session_state.status_data:
                             status = st.session_state.status_data[cause]
                             status_emoji = {"green": "🟢", "amber": "🟠", "red": "🔴"}.get(status, "⚪")
-                            process_name = get_process_names().get(cause, cause)
+                            process_name = PROCESS_NAMES.get(cause, cause)
                             
                             # Highlight problematic upstream processes
                             if status in ['red', 'amber']:
@@ -1362,7 +1366,7 @@ def render_root_cause_analysis():
         
         kpi_df_data = []
         for process_id, kpi in process_kpis.items():
-            process_name = get_process_names().get(process_id, 'Unknown')
+            process_name = PROCESS_NAMES.get(process_id, 'Unknown')
             status = st.session_state.status_data.get(process_id, 'unknown')
             
             kpi_df_data.append({
@@ -76,7 +76,7 @@ def get_process_names():
     process_data = load_process_details()
     process_names = {}
     for process in process_data:
-        process_names[process['qid']] = process['process']
+        process_names[process.qid] = process.process
     return process_names
 
 # Generate mock status data for processes
@@ -292,7 +292,7 @@ def map_processes_to_kpis(processes):
     
     for pid in processes:
         if pid in KPI_MATRIX:
-            process_kpis[pid] = KPI_MATRIX[pid]["kpi"]
+            process_kpis[pid] = KPI_MATRIX[pid].kpi
     
     return process_kpis
 
@@ -454,7 +454,7 @@ def render_root_cause_analysis():
     
     # Get all process IDs
     process_data = load_process_details()
-    all_process_ids = [p['qid'] for p in process_data]
+    all_process_ids = [p.qid for p in process_data]
     
     # Scenario-specific problem areas
     scenario_problems = {
@@ -807,7 +807,7 @@ def get_process_names():
     process_data = load_process_details()
     process_names = {}
     for process in process_data:
-        process_names[process['qid']] = process['process']
+        process_names[process.qid] = process.process
     return process_names
 
 # Generate mock status data for processes
@@ -1023,7 +1023,7 @@ def map_processes_to_kpis(processes):
     
     for pid in processes:
         if pid in KPI_MATRIX:
-            process_kpis[pid] = KPI_MATRIX[pid]["kpi"]
+            process_kpis[pid] = KPI_MATRIX[pid].kpi
     
     return process_kpis
 
@@ -1185,7 +1185,7 @@ def render_root_cause_analysis():
     
     # Get all process IDs
     process_data = load_process_details()
-    all_process_ids = [p['qid'] for p in process_data]
+    all_process_ids = [p.qid for p in process_data]
     
     # Scenario-specific problem areas
     scenario_problems = {
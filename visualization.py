@@ -3,6 +3,9 @@ import pandas as pd
 import streamlit as st
 from data_loader import get_stage_names
 
+# Above this many traces the radar chart switches to the WebGL renderer
+WEBGL_TRACE_THRESHOLD = 15
+
 
 def create_radar_chart(banks_data,
                        selected_banks,
@@ -23,6 +26,10 @@ def create_radar_chart(banks_data,
 
     fig = go.Figure()
 
+    # SVG rendering degrades with many traces, so use WebGL when many are drawn
+    drawn = sum(bank in banks_data for bank in selected_banks)
+    trace_type = go.Scatterpolargl if drawn > WEBGL_TRACE_THRESHOLD else go.Scatterpolar
+
     for bank in selected_banks:
         if bank in banks_data:
             values = [banks_data[bank][i] for i in range(1, 13)]
@@ -33,10 +40,10 @@ def create_radar_chart(banks_data,
             categories_plot.append(categories[0])
 
             fig.add_trace(
-                go.Scatterpolar(r=values,
-                                theta=categories_plot,
-                                fill='toself',
-                                name=bank))
+                trace_type(r=values,
+                           theta=categories_plot,
+                           fill='toself',
+                           name=bank))
 
     fig.update_layout(
         polar=dict(
@@ -68,13 +75,12 @@ def create_stage_chart(bank_data, stage_id, comparison_banks=None):
         process_count = 0
 
         # Get processes for this stage
-        from data_loader import get_process_data_for_stage
-        stage_processes = get_process_data_for_stage(stage_id)
+        from data_loader import STAGE_PROCESS_IDS
 
         # Sum the scores for each process in this stage
-        for process in stage_processes:
-            if process['qid'] in bank_data:
-                stage_total += bank_data[process['qid']]
+        for qid in STAGE_PROCESS_IDS[stage_id]:
+            if qid in bank_data:
+                stage_total += bank_data[qid]
                 process_count += 1
 
         # Add to the chart